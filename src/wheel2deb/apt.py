@@ -1,6 +1,6 @@
 import re
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, Iterable, Optional, Set, Tuple
 
 import attr
 
@@ -15,10 +15,15 @@ PACKAGE_VER_RE = re.compile(
 
 APT_CACHE_MADISON_RE = re.compile(r"[^|]+\|([^|]+)\|[^|]+")
 
+APT_FILE_RE = re.compile(r"(.*lib.+):\s((?:/usr/lib/|/lib/)\S*)")
+
 logger = logging.getLogger(__name__)
 
 _cache = None
 
+# packages providing shared libs, indexed by (lib, arch)
+_lib_packages_cache: Dict[Tuple[str, str], Set[str]] = {}
+
 
 @attr.s(frozen=True)
 class Package:
@@ -56,3 +61,53 @@ def search_packages(names, arch):
 
     for name in names:
         yield search_package(name, arch)
+
+
+def apt_file_search(libs, arch) -> Dict[str, Set[str]]:
+    """
+    Search packages providing shared libs with a single apt-file call
+    :return: Dict mapping each lib to the set of packages providing it,
+    dbg packages excluded
+    """
+    lib_packages = {lib: set() for lib in libs}
+
+    pattern = "|".join(re.escape(lib) for lib in libs)
+    output, _ = shell(["apt-file", "--regexp", "search", pattern, "-a", arch])
+    matches = list(APT_FILE_RE.finditer(output))
+
+    if not matches and len(libs) > 1:
+        # combined search failed, fall back to one search per lib
+        for lib in libs:
+            output, _ = shell(["apt-file", "search", lib, "-a", arch])
+            lib_packages[lib].update(
+                m.group(1)
+                for m in APT_FILE_RE.finditer(output)
+                if not m.group(1).endswith("dbg")
+            )
+        return lib_packages
+
+    for match in matches:
+        package, path = match.groups()
+        if package.endswith("dbg"):
+            continue
+        for lib in libs:
+            if lib in path:
+                lib_packages[lib].add(package)
+
+    return lib_packages
+
+
+def search_lib_packages(libs: Iterable[str], arch: str) -> Dict[str, Set[str]]:
+    """
+    Search packages providing shared libs, apt-file is only
+    called for libs that were not already searched by this process
+    """
+    libs = set(libs)
+    uncached = [lib for lib in libs if (lib, arch) not in _lib_packages_cache]
+
+    if uncached:
+        logger.debug(f"searching {' '.join(uncached)} with apt-file...")
+        for lib, packages in apt_file_search(uncached, arch).items():
+            _lib_packages_cache[(lib, arch)] = packages
+
+    return {lib: _lib_packages_cache[(lib, arch)] for lib in libs}
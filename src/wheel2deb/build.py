@@ -8,6 +8,10 @@ from wheel2deb.utils import shell
 
 logger = logging.getLogger(__name__)
 
+CONTROL_FIELD_RE = re.compile(r"^([\w-]+)\s*:\s*(.+)")
+
+CONTROL_DEPENDS_RE = re.compile(r"([^=\s,()]+)\s?(?:\([^)]+\))?")
+
 
 def parse_debian_control(cwd: Path):
     """
@@ -16,19 +20,16 @@ def parse_debian_control(cwd: Path):
     :return: Dict object with fields as keys
     """
 
-    field_re = re.compile(r"^([\w-]+)\s*:\s*(.+)")
-
     content = (cwd / "debian" / "control").read_text()
     control = {}
     for line in content.split("\n"):
-        m = field_re.search(line)
+        m = CONTROL_FIELD_RE.search(line)
         if m:
             g = m.groups()
             control[g[0]] = g[1]
 
     for k in ("Build-Depends", "Depends"):
-        m = re.findall(r"([^=\s,()]+)\s?(?:\([^)]+\))?", control[k])
-        control[k] = m
+        control[k] = CONTROL_DEPENDS_RE.findall(control[k])
 
     return control
 
@@ -1,4 +1,5 @@
 import configparser
+import io
 import os
 import re
 import shutil
@@ -11,11 +12,12 @@ from setuptools.command.install_scripts import install_scripts
 from setuptools.dist import Distribution
 
 from wheel2deb import logger as logging
+from wheel2deb.apt import search_lib_packages
 from wheel2deb.context import Settings
 from wheel2deb.depends import normalize_package_version, search_python_deps, suggest_name
 from wheel2deb.pydist import Wheel
-from wheel2deb.templates import environment
-from wheel2deb.utils import shell
+from wheel2deb.templates import environment, static_template
+from wheel2deb.utils import shell, write_if_changed
 from wheel2deb.version import __version__
 
 logger = logging.getLogger(__name__)
@@ -24,15 +26,16 @@ dirsync_logger.setLevel(logging.ERROR)
 
 EXTRACT_PATH = Path("/tmp/wheel2deb")
 
+# the notice is bounded to a single line of at most 500 chars
+# to avoid catastrophic backtracking on long license texts
 COPYRIGHT_RE = re.compile(
-    r"(?:copyrights?|\s*©|\s*\(c\))[\s:|,]*" r"((?=.*[a-z])\d{2,4}(?:(?!all\srights).)+)",
-    re.IGNORECASE,
+    r"(?:copyrights?|\s*©|\s*\(c\))[\s:|,]*"
+    r"((?=.*[a-z])\d{2,4}[^\n]{0,500}?)[^\S\n]*(?=all\s+rights|$)",
+    re.IGNORECASE | re.MULTILINE,
 )
 
 DPKG_SHLIBS_RE = re.compile(r"find library (.+\.so[.\d]*) needed")
 
-APT_FILE_RE = re.compile(r"(.*lib.+):\s(?:/usr/lib/|/lib/)")
-
 
 def platform_to_arch(platform_tag):
     translation_table = {
@@ -88,13 +91,15 @@ class SourcePackage:
 
         version_without_epoch = self.version.split(":")[-1]
         # debian package full filename
-        self.filename = "%s_%s_%s.deb" % (self.name, version_without_epoch, self.arch)
+        self.filename = f"{self.name}_{version_without_epoch}_{self.arch}.deb"
 
         # root directory of the debian source package
         self.root = Path(output) / self.filename[:-4]
         # relative path to wheel.extract_path from self.root
         # contains the files extracted from the wheel
         self.src = Path("src")
+        # self.src as a string prefix, to build paths in loops
+        self._src_prefix = str(self.src) + os.sep
         # debian directory path
         # holds the package config files
         self.debian = self.root / "debian"
@@ -112,8 +117,8 @@ class SourcePackage:
 
         # compute package run dependencies
         self.depends = ["%s:any" % self.interpreter]
-        if wheel.version_range(self.pyvers):
-            vrange = wheel.version_range(self.pyvers)
+        vrange = wheel.version_range(self.pyvers)
+        if vrange:
             if vrange.max:
                 self.depends.append("%s (<< %s)" % (self.interpreter, vrange.max))
             if vrange.min:
@@ -124,8 +129,11 @@ class SourcePackage:
         self.depends.extend(ctx.depends)
 
         # write unsatisfied requirements in missing.txt
-        with open(str(self.root / "missing.txt"), "w") as f:
-            f.write("\n".join(missing) + "\n")
+        missing_file = self.root / "missing.txt"
+        if missing:
+            missing_file.write_bytes(("\n".join(missing) + "\n").encode())
+        else:
+            missing_file.unlink(missing_ok=True)
 
         # wheel modules install path
         if self.pyvers.major == 2:
@@ -138,37 +146,36 @@ class SourcePackage:
         Generate debian/install
         """
         install = set()
+        src = self._src_prefix
 
-        for d in os.listdir(str(self.wheel.extract_path)):
-            if not d.endswith(".data"):
-                install.add(str(self.src / d) + " " + self.install_path)
-            else:
-                purelib = self.wheel.extract_path / d / "purelib"
-                if purelib.exists():
-                    install.add(
-                        str(self.src / d / "purelib" / "*") + " " + self.install_path
-                    )
+        with os.scandir(self.wheel.extract_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".data"):
+                    install.add(src + entry.name + " " + self.install_path)
+                elif os.path.isdir(os.path.join(entry.path, "purelib")):
+                    install.add(src + entry.name + "/purelib/* " + self.install_path)
 
         if self.wheel.entrypoints and not self.ctx.ignore_entry_points:
             self.run_install_scripts()
-            if (Path(self.root) / "entrypoints").exists():
+            if (self.root / "entrypoints").exists():
                 install.add("entrypoints/* /usr/bin/")
 
-        for script in self.wheel.record.scripts:
-            install.add(str(self.src / script) + " /usr/bin/")
+        install.update(
+            src + script + " /usr/bin/" for script in self.wheel.record.scripts
+        )
 
-        with (self.debian / "install").open("w") as f:
-            f.write("\n".join(install))
+        content = "\n".join(sorted(install)) + "\n"
+        write_if_changed(self.debian / "install", content.encode())
 
     def rules(self):
         """
         Generate debian/rules
         """
+        src = self._src_prefix
+        lib_dirs = self.wheel.record.lib_dirs
         self.dump_template(
             "rules",
-            shlibdeps_params="".join(
-                [" -l" + str(self.src / x) for x in self.wheel.record.lib_dirs]
-            ),
+            shlibdeps_params="".join(" -l" + src + x for x in lib_dirs),
         )
 
     def copyright(self):
@@ -178,31 +185,34 @@ class SourcePackage:
         """
         licenses = self.wheel.record.licenses
         license_file = None
-        license_content = ""
+        license_text = ""
         copyrights = set()
 
         if not licenses:
             logger.warning("no license found !")
             return
 
-        # gather copyrights from all licenses
+        for file in licenses:
+            if "dist-info" in file:
+                license_file = file
+        if not license_file:
+            license_file = licenses[0]
+
+        # gather copyrights from all licenses, only keeping
+        # the text of the license copied in debian/copyright
         for lic in licenses:
             content = (self.wheel.extract_path / lic).read_text()
-            copyrights.update(set(re.findall(COPYRIGHT_RE, content)))
+            if lic == license_file:
+                license_text = content
+            copyrights.update(m.group(1) for m in COPYRIGHT_RE.finditer(content))
 
         copyrights = sorted(list(copyrights))
 
         logger.debug("found the following copyrights: %s", copyrights)
 
-        for file in licenses:
-            if "dist-info" in file:
-                license_file = file
-        if not license_file:
-            license_file = licenses[0]
-
-        with (self.wheel.extract_path / license_file).open() as f:
-            for line in f.readlines():
-                license_content += " " + line
+        # indent each line of the license text by one space
+        lines = io.StringIO(license_text).readlines()
+        license_content = "".join(" " + line for line in lines)
 
         if license_content:
             self.dump_template(
@@ -223,7 +233,6 @@ class SourcePackage:
 
         for template in [
             "changelog",
-            "control",
             "compat",
             "postinst",
             "prerm",
@@ -234,29 +243,30 @@ class SourcePackage:
         self.rules()
         self.install()
         self.copyright()
-
-        # dpkg-shlibdeps won't work without debian/control
         self.search_shlibs_deps()
 
-        # re-generate debian/control with deps found by dpkg-shlibdeps
+        # debian/control depends on deps found by dpkg-shlibdeps
         self.dump_template("control")
 
     def dump_template(self, template_name, **kwargs):
-        template = environment.get_template(template_name)
-        output_path = str(self.debian / template_name)
-        template.stream(package=self, ctx=self.ctx, **kwargs).dump(output_path)
+        content = static_template(template_name)
+        if content is None:
+            template = environment.get_template(template_name)
+            content = template.render(package=self, ctx=self.ctx, **kwargs)
+        write_if_changed(self.debian / template_name, content.encode())
 
     def fix_shebangs(self):
+        shebang = b"#!/usr/bin/env python%d" % self.ctx.python_version.major
         files = [self.root / self.src / x for x in self.wheel.record.scripts]
         for file in files:
-            content = file.read_text()
-            shebang = "#!/usr/bin/env python%s" % self.ctx.python_version.major
-            if not content.startswith(shebang):
-                content = content.split("\n")
-                content[0] = shebang
-                content = "\n".join(content)
-                with file.open("w") as g:
-                    g.write(content)
+            with file.open("rb") as f:
+                head = f.read(len(shebang))
+                if head == shebang:
+                    continue
+                content = head + f.read()
+            # replace the first line of the script with the right shebang
+            eol = content.find(b"\n")
+            file.write_bytes(shebang + (content[eol:] if eol != -1 else b""))
 
     def search_shlibs_deps(self):
         """
@@ -265,19 +275,26 @@ class SourcePackage:
         """
         shlibdeps = set()
         missing_libs = set()
-        shlibdeps_file = "shlibdeps.txt"
+        shlibdeps_file = self.root / "shlibdeps.txt"
+
+        if shlibdeps_file.is_file():
+            shlibdeps = set(shlibdeps_file.read_text().split("\n"))
 
-        if (self.root / shlibdeps_file).exists():
-            shlibdeps = set((self.root / shlibdeps_file).read_text().split("\n"))
+        # pure python wheels have no shared libs to look for
+        has_libs = self.arch != "all" and self.wheel.record.lib_dirs
 
-        if self.wheel.record.lib_dirs and not shlibdeps:
+        if has_libs and not shlibdeps:
+            # dpkg-shlibdeps won't work without debian/control
+            self._write_minimal_control()
+            src = self._src_prefix
+            record = self.wheel.record
             args = (
                 ["dpkg-shlibdeps"]
-                + ["-l" + str(self.src / x) for x in self.wheel.record.lib_dirs]
-                + [str(self.src / x) for x in self.wheel.record.libs]
+                + ["-l" + src + x for x in record.lib_dirs]
+                + [src + x for x in record.libs]
             )
             output, _ = shell(args, cwd=self.root)
-            missing_libs.update(DPKG_SHLIBS_RE.findall(output, re.MULTILINE))
+            missing_libs.update(DPKG_SHLIBS_RE.findall(output))
 
         if missing_libs:
             logger.info(
@@ -287,37 +304,45 @@ class SourcePackage:
             )
 
             # search packages providing those libs
+            lib_packages = search_lib_packages(missing_libs, self.arch)
             for lib in missing_libs:
-                output, _ = shell(["apt-file", "search", lib, "-a", self.arch])
-                packages = set(APT_FILE_RE.findall(output))
+                packages = lib_packages[lib]
 
-                # remove dbg packages
-                packages = [p for p in packages if p[-3:] != "dbg"]
-
-                if not len(packages):
+                if not packages:
                     logger.warning("did not find a package providing %s", lib)
-                else:
-                    # we pick the package with the shortest name
-                    packages = sorted(packages, key=len)
-                    shlibdeps.add(packages[0])
+                    continue
+
+                # we pick the package with the shortest name
+                pick = min(packages, key=len)
+                shlibdeps.add(pick)
 
                 if len(packages) > 1:
                     logger.warning(
                         "several packages providing %s: %s, picking %s, "
                         "edit debian/control to use another one.",
                         lib,
-                        packages,
-                        packages[0],
+                        sorted(packages, key=len),
+                        pick,
                     )
 
-            with open(str(self.root / shlibdeps_file), "w") as f:
-                f.write("\n".join(shlibdeps))
+            shlibdeps_file.write_text("\n".join(shlibdeps))
 
         if shlibdeps:
             logger.info("detected dependencies: %s", shlibdeps)
 
         self.depends = list(set(self.depends) | shlibdeps)
 
+    def _write_minimal_control(self):
+        """
+        Write a debian/control with just enough fields for dpkg-shlibdeps,
+        it is overwritten by the full template once dependencies are known
+        """
+        (self.debian / "control").write_text(
+            f"Source: {self.name}\n\n"
+            f"Package: {self.name}\n"
+            f"Architecture: {self.arch}\n"
+        )
+
     def run_install_scripts(self):
 
         config = configparser.ConfigParser()
@@ -42,7 +42,7 @@ class Record:
         files = [line.rstrip().split(",")[0] for line in content.split("\n")]
         record = Record()
         for file in files:
-            if re.search(cls.LICENSE_RE, file):
+            if cls.LICENSE_RE.search(file):
                 logger.debug(f"found license: {file}")
                 record.licenses.append(file)
                 continue
@@ -52,7 +52,7 @@ class Record:
                 record.scripts.append(file)
                 continue
 
-            if re.findall(cls.SHLIBS_RE, os.path.basename(file)):
+            if cls.SHLIBS_RE.search(os.path.basename(file)):
                 logger.debug(f"found shared lib: {file}")
                 record.libs.append(file)
 
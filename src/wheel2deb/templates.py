@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional
 
 from jinja2 import Environment, FunctionLoader
@@ -101,4 +102,17 @@ def template_loader(name: str) -> Optional[str]:
     return None
 
 
-environment = Environment(loader=FunctionLoader(template_loader))
+@lru_cache
+def static_template(name: str) -> Optional[str]:
+    """
+    Content of a template without any jinja syntax, None for other templates
+    """
+    content = template_loader(name)
+    if content is None or any(tag in content for tag in ("{{", "{%", "{#")):
+        return None
+    # jinja strips a single trailing newline when rendering
+    return content.removesuffix("\n")
+
+
+# templates are in-memory constants: compile them once and never check for changes
+environment = Environment(loader=FunctionLoader(template_loader), auto_reload=False)
@@ -8,3 +8,18 @@ def shell(args: List[str], cwd: Path | None = None) -> Tuple[str, int]:
         args, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
     )
     return result.stdout.decode("utf-8"), result.returncode
+
+
+def write_if_changed(path: Path, content: bytes) -> bool:
+    """
+    Write content to path unless the file already holds it,
+    so that unchanged files keep their mtime
+    :return: True if the file was written
+    """
+    try:
+        if path.stat().st_size == len(content) and path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(content)
+    return True
@@ -1,4 +1,12 @@
-from wheel2deb.apt import Package
+from unittest.mock import patch
+
+from wheel2deb.apt import Package, search_lib_packages
+
+APT_FILE_OUTPUT = """\
+libfoo1: /usr/lib/x86_64-linux-gnu/libfoo.so.1
+libfoo1-dbg: /usr/lib/debug/libfoo.so.1
+libbar2: /lib/x86_64-linux-gnu/libbar.so.2.0.1
+"""
 
 
 def test_package_name_parsing():
@@ -10,3 +18,16 @@ def test_package_name_parsing():
 
     bar = Package.factory("bar", "3-1-1")
     assert bar.version == "3-1" and bar.revision == "1"
+
+
+def test_search_lib_packages():
+    libs = {"libfoo.so.1", "libbar.so.2"}
+    with patch("wheel2deb.apt.shell", return_value=(APT_FILE_OUTPUT, 0)) as shell:
+        lib_packages = search_lib_packages(libs, "amd64")
+        # results are cached, apt-file is only called once
+        assert search_lib_packages(libs, "amd64") == lib_packages
+    shell.assert_called_once()
+    assert lib_packages == {
+        "libfoo.so.1": {"libfoo1"},
+        "libbar.so.2": {"libbar2"},
+    }
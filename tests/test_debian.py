@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import pytest
+
+from wheel2deb.debian import COPYRIGHT_RE, SourcePackage
+
+LICENSE = """\
+MIT License
+
+Copyright (c) 2017 John Doe
+Copyright: 2018-2019 Jane Doe. All rights reserved.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+"""
+
+
+def test_copyright_re():
+    assert COPYRIGHT_RE.findall(LICENSE) == ["2017 John Doe", "2018-2019 Jane Doe."]
+
+
+def test_copyright_re_long_line():
+    content = "copyright 2019 " + "a" * 100000
+    assert COPYRIGHT_RE.findall(content) == []
+
+
+@pytest.fixture
+def dump_copyright(tmp_path):
+    """
+    Generate debian/copyright for a single license file
+    """
+
+    def _dump_copyright(license_text: str) -> str:
+        (tmp_path / "debian").mkdir()
+        (tmp_path / "LICENSE").write_text(license_text)
+        package = SourcePackage.__new__(SourcePackage)
+        package.debian = tmp_path / "debian"
+        package.license = "custom"
+        package.ctx = None
+        package.wheel = SimpleNamespace(
+            extract_path=tmp_path, record=SimpleNamespace(licenses=["LICENSE"])
+        )
+        package.copyright()
+        return (tmp_path / "debian" / "copyright").read_text()
+
+    return _dump_copyright
+
+
+def test_copyright_license_content(dump_copyright):
+    content = dump_copyright("Line one\n\x0cTERMS\n")
+    assert content.endswith("License: custom\n Line one\n \x0cTERMS\n")
+
+
+def test_copyright_whole_license(dump_copyright):
+    content = dump_copyright(
+        "Copyright (c) 2017 John Doe\n"
+        + "terms and conditions\n" * 1000
+        + "Copyright (c) 1995-2001 Corporation for National Research Initiatives\n"
+    )
+    assert "1995-2001 Corporation for National Research Initiatives" in content
@@ -0,0 +1,7 @@
+from wheel2deb.templates import environment, static_template
+
+
+def test_static_template():
+    assert static_template("compat") == environment.get_template("compat").render()
+    assert static_template("rules") == environment.get_template("rules").render()
+    assert static_template("control") is None
@@ -0,0 +1,9 @@
+from wheel2deb.utils import write_if_changed
+
+
+def test_write_if_changed(tmp_path):
+    path = tmp_path / "control"
+    assert write_if_changed(path, b"Source: foo\n")
+    assert not write_if_changed(path, b"Source: foo\n")
+    assert write_if_changed(path, b"Source: bar\n")
+    assert path.read_bytes() == b"Source: bar\n"